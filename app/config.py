@@ -1,40 +1,56 @@
 """Configuration management for A2A Guestbook application."""
 
 import os
-from typing import Optional
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dataclasses import dataclass
+from functools import lru_cache
 
+from dotenv import load_dotenv
 
-class Config(BaseSettings):
-    """Application configuration loaded from environment variables."""
+# Hoisted so validation doesn't rebuild the candidates on every invocation
+# (cheap today, but validate_config may move onto a config-refresh path).
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_LOG_LEVELS_STR = ", ".join(sorted(_VALID_LOG_LEVELS))
+
+# Values (lowercased) interpreted as False for boolean settings
+_FALSY = frozenset({"0", "false", "no", "off"})
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Application configuration loaded from environment variables.
+
+    A plain frozen dataclass populated by direct os.environ reads: with only
+    a handful of fields, hand-rolled loading is much cheaper than the
+    pydantic-settings machinery (Field metadata walk, settings sources,
+    validators) and shaves cold-start time on pod rollouts.
+    """
 
     # AWS Configuration (Required)
     aws_region: str
     dynamodb_table_name: str
 
     # API Keys (injected from K8s Secret via ESO)
-    api_keys: str  # JSON array of API keys, e.g., '["key1","key2"]'
+    # Defaults to empty so the value is resolved lazily: importing config does
+    # not require the secret to be present, and load_api_keys() surfaces a
+    # clear startup error instead of an import-time crash.
+    api_keys: str = ""  # JSON array of API keys, e.g., '["key1","key2"]'
 
     # Application Configuration (Optional with defaults)
     rate_limit_per_minute: int = 10
     log_level: str = "INFO"
     port: int = 8000
-
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore"
-    )
+    enable_prometheus: bool = True
+    # 0 disables the background refresh task; ESO-synced secrets normally
+    # arrive via pod restart, so in-process refresh is opt-in
+    api_key_refresh_interval_seconds: int = 0
 
     def validate_config(self) -> None:
         """Validate configuration values."""
         # Validate log level
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level.upper() not in valid_log_levels:
+        if self.log_level.upper() not in _VALID_LOG_LEVELS:
             raise ValueError(
                 f"Invalid LOG_LEVEL: {self.log_level}. "
-                f"Must be one of: {', '.join(valid_log_levels)}"
+                f"Must be one of: {_VALID_LOG_LEVELS_STR}"
             )
 
         # Validate rate limit
@@ -49,10 +65,63 @@ class Config(BaseSettings):
                 f"PORT must be between 1 and 65535, got: {self.port}"
             )
 
+        # Validate key refresh interval (0 = disabled)
+        if self.api_key_refresh_interval_seconds < 0:
+            raise ValueError(
+                f"API_KEY_REFRESH_INTERVAL_SECONDS must be >= 0, "
+                f"got: {self.api_key_refresh_interval_seconds}"
+            )
+
+
+def _load_config() -> Config:
+    """Read configuration from the environment with typed coercion.
+
+    Raises:
+        ValueError: If a required variable is missing or a value fails
+            integer coercion.
+    """
+    # .env file support for local development; no-op when the file is absent
+    load_dotenv()
+
+    env = os.environ.get
+
+    missing = [
+        name for name in ("AWS_REGION", "DYNAMODB_TABLE_NAME") if not env(name)
+    ]
+    if missing:
+        raise ValueError(
+            f"Missing required environment variables: {', '.join(missing)}"
+        )
+
+    try:
+        rate_limit_per_minute = int(env("RATE_LIMIT_PER_MINUTE", "10"))
+        port = int(env("PORT", "8000"))
+        api_key_refresh_interval_seconds = int(
+            env("API_KEY_REFRESH_INTERVAL_SECONDS", "0")
+        )
+    except ValueError as e:
+        raise ValueError(f"Invalid integer in environment configuration: {e}")
+
+    return Config(
+        aws_region=env("AWS_REGION"),
+        dynamodb_table_name=env("DYNAMODB_TABLE_NAME"),
+        api_keys=env("API_KEYS", ""),
+        rate_limit_per_minute=rate_limit_per_minute,
+        log_level=env("LOG_LEVEL", "INFO"),
+        port=port,
+        enable_prometheus=env("ENABLE_PROMETHEUS", "true").strip().lower() not in _FALSY,
+        api_key_refresh_interval_seconds=api_key_refresh_interval_seconds,
+    )
 
 
-# Global configuration instance
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Build, validate and cache the application configuration.
 
-# Validate configuration on module import
-config.validate_config()
+    Lazily constructing the instance keeps env/.env parsing off the module
+    import path and lets tests clear the cache instead of monkeypatching a
+    module global.
+    """
+    config = _load_config()
+    config.validate_config()
+    return config
@@ -11,29 +11,104 @@ Usage:
 
 import logging
 import os
+import time
 
+import orjson
 import structlog
 from opentelemetry import trace
 
 
+def _json_dumps(event_dict, **kwargs) -> bytes:
+    """Serialize a log event with orjson (C-level, single pass).
+
+    Returns bytes so the log line goes straight to sys.stdout.buffer without
+    a decode/re-encode round-trip through the text layer. default=str covers
+    values orjson can't natively encode, so no per-field serializability
+    probing is needed.
+    """
+    return orjson.dumps(event_dict, default=str)
+
+# Bound as locals of the timestamp processor so each record pays two C calls
+# instead of the datetime.now(timezone.utc).isoformat() allocation chain.
+_gmtime = time.gmtime
+_strftime = time.strftime
+_time = time.time
+
+# Shared result for records emitted outside a valid span. Allocated once so the
+# common no-span case (tests, local dev) doesn't build a new dict per log record.
+# Callers must treat this as read-only.
+_NULL_TRACE = {"trace_id": None, "span_id": None}
+
+# Memo of the most recently formatted span context. A request emits several
+# log lines under the same span, so the hex formatting is done once per span
+# instead of once per record. Benign race under concurrency: worst case is a
+# recompute, never a wrong value.
+_last_trace_key = (0, 0)
+_last_trace_ctx = _NULL_TRACE
+
+# Lazily resolved flag: True once a real tracer provider is installed, False
+# when running without an OTel SDK (tests, local dev without OTLP endpoint).
+_tracing_active = None
+
+
+def _tracer_installed() -> bool:
+    """Check (once) whether a real tracer provider is installed.
+
+    setup_tracing() runs before logging is configured, so the provider state
+    is settled by the time the first log record is emitted. Caching the
+    answer lets the no-SDK case skip span lookups entirely.
+    """
+    global _tracing_active
+    if _tracing_active is None:
+        provider = trace.get_tracer_provider()
+        _tracing_active = not isinstance(provider, trace.ProxyTracerProvider) and (
+            type(provider).__name__ != "NoOpTracerProvider"
+        )
+    return _tracing_active
+
+
 def get_trace_context() -> dict:
     """Extract trace context from current OpenTelemetry span.
-    
+
     Returns:
         dict: Contains trace_id (X-Ray format) and span_id, or None values if no valid span.
     """
+    if not _tracer_installed():
+        return _NULL_TRACE
+
     span = trace.get_current_span()
     ctx = span.get_span_context()
 
     if ctx.is_valid:
+        global _last_trace_key, _last_trace_ctx
+
+        key = (ctx.trace_id, ctx.span_id)
+        if key == _last_trace_key:
+            return _last_trace_ctx
+
         # Format trace_id as X-Ray format: 1-{first 8 hex}-{remaining 24 hex}
         trace_id_hex = format(ctx.trace_id, "032x")
         xray_trace_id = f"1-{trace_id_hex[:8]}-{trace_id_hex[8:]}"
-        return {
+        _last_trace_ctx = {
             "trace_id": xray_trace_id,
             "span_id": format(ctx.span_id, "016x"),
         }
-    return {"trace_id": None, "span_id": None}
+        _last_trace_key = key
+        return _last_trace_ctx
+    return _NULL_TRACE
+
+
+def add_timestamp(logger, method_name, event_dict):
+    """Structlog processor adding an ISO-8601 UTC timestamp from epoch time.
+
+    Formats directly from time.time() via gmtime/strftime, avoiding the
+    per-record datetime + tzinfo allocations of TimeStamper(fmt="iso").
+    """
+    now = _time()
+    event_dict["timestamp"] = (
+        f"{_strftime('%Y-%m-%dT%H:%M:%S', _gmtime(now))}.{int(now % 1 * 1000):03d}Z"
+    )
+    return event_dict
 
 
 def add_trace_context(logger, method_name, event_dict):
@@ -42,48 +117,90 @@ def add_trace_context(logger, method_name, event_dict):
     return event_dict
 
 
+# Service metadata is fixed for the process lifetime; resolve it once instead
+# of hitting os.getenv twice per log record.
+_SERVICE_CONTEXT = {
+    "service": os.getenv("OTEL_SERVICE_NAME", "guestbook"),
+    "environment": os.getenv("ENVIRONMENT", "unknown"),
+}
+
+
 def add_service_context(logger, method_name, event_dict):
     """Structlog processor to add service metadata."""
-    event_dict["service"] = os.getenv("OTEL_SERVICE_NAME", "guestbook")
-    event_dict["environment"] = os.getenv("ENVIRONMENT", "unknown")
+    event_dict.update(_SERVICE_CONTEXT)
     return event_dict
 
 
+# Level-name lookup table; avoids a getattr walk over the logging module
+_LEVEL_MAP = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+# Library loggers quieted to WARNING during configuration
+_NOISY_LOGGERS = (
+    "uvicorn.access",
+    "botocore",
+    "boto3",
+    "urllib3",
+    "opentelemetry",
+)
+
+# Processor chain is identical for every configure call; build it once.
+_PROCESSORS = [
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    add_timestamp,
+    add_service_context,
+    add_trace_context,
+    structlog.processors.JSONRenderer(serializer=_json_dumps),
+]
+
+# Idempotency guard so repeated calls (e.g. tests reinitializing logging)
+# don't redo configuration
+_logging_configured = False
+
+# Shared logger proxy returned by get_logger(); with
+# cache_logger_on_first_use=True the underlying bound logger is materialized
+# once and reused by every call site instead of being rebuilt per lookup.
+_logger = structlog.get_logger()
+
+
 def configure_logging(level: str = "INFO") -> None:
     """Configure structlog for JSON output with trace context.
 
     This replaces the default logging configuration with JSON output
     that includes OpenTelemetry trace context and service metadata.
+    Repeated calls are no-ops.
 
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
+    global _logging_configured
+
+    if _logging_configured:
+        return
+    _logging_configured = True
+
     # Convert level string to logging level
-    log_level = getattr(logging, level.upper(), logging.INFO)
+    log_level = _LEVEL_MAP.get(level.upper(), logging.INFO)
 
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            add_service_context,
-            add_trace_context,
-            structlog.processors.JSONRenderer(),
-        ],
+        processors=_PROCESSORS,
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        # BytesLogger writes the pre-encoded line to sys.stdout.buffer in one
+        # call with no per-message flush, unlike PrintLogger which pays for
+        # the text-IO encode plus an explicit flush per record.
+        logger_factory=structlog.BytesLoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
-    # Suppress uvicorn access logs (we log requests ourselves via middleware)
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-
-    # Reduce noise from verbose libraries
-    logging.getLogger("botocore").setLevel(logging.WARNING)
-    logging.getLogger("boto3").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("opentelemetry").setLevel(logging.WARNING)
+    # Quiet noisy library loggers in one pass. uvicorn.access is suppressed
+    # because we log requests ourselves via middleware.
+    _getLogger = logging.getLogger
+    for name in _NOISY_LOGGERS:
+        _getLogger(name).setLevel(logging.WARNING)
 
     # Log that structured logging is configured
     logger = structlog.get_logger()
@@ -91,15 +208,15 @@ def configure_logging(level: str = "INFO") -> None:
 
 
 def get_logger(name: str = None):
-    """Get a structlog logger instance.
-    
+    """Get the shared structlog logger instance.
+
     Args:
         name: Optional logger name (not used by structlog but kept for compatibility)
-        
+
     Returns:
         A structlog bound logger instance
     """
-    return structlog.get_logger()
+    return _logger
 
 
 # Legacy alias for backward compatibility
@@ -5,27 +5,32 @@
 from app.tracing import setup_tracing, instrument_fastapi, get_current_trace_id
 setup_tracing()
 
+import asyncio
 from contextlib import asynccontextmanager
 
 import structlog
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from prometheus_fastapi_instrumentator import Instrumentator
-from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.config import config
+from app.config import get_config
 from app.logging_config import configure_logging
 from app.middleware import (
     AuthMiddleware,
     RequestLoggingMiddleware,
     load_api_keys,
+    refresh_api_keys_periodically,
     limiter,
 )
 from app.routers import a2a_router, public_router
+from app.services.dynamodb import get_dynamodb_service
+
+# Resolve configuration once for this entry-point module
+config = get_config()
 
 # Configure structured JSON logging with trace correlation
 configure_logging(level=config.log_level)
@@ -33,25 +38,6 @@ configure_logging(level=config.log_level)
 logger = structlog.get_logger()
 
 
-class TraceIdMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to add X-Amzn-Trace-Id header to responses.
-
-    This allows clients to correlate their requests with X-Ray traces
-    for debugging and monitoring purposes.
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-
-        # Add trace ID to response headers if available
-        trace_id = get_current_trace_id()
-        if trace_id:
-            response.headers["X-Amzn-Trace-Id"] = f"Root={trace_id}"
-
-        return response
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -60,11 +46,12 @@ async def lifespan(app: FastAPI):
     Handles:
     - Loading API keys from environment variable on startup
       (injected from K8s Secret, synced by External Secrets Operator)
+    - Optionally starting the background key-refresh task when
+      API_KEY_REFRESH_INTERVAL_SECONDS > 0
     """
-    # Startup
-    logger.info("application_starting")
+    # Startup (single log call; one processor-chain pass instead of two)
     logger.info(
-        "configuration_loaded",
+        "application_starting",
         region=config.aws_region,
         table=config.dynamodb_table_name,
         rate_limit=config.rate_limit_per_minute,
@@ -75,16 +62,30 @@ async def lifespan(app: FastAPI):
         load_api_keys()
         logger.info("api_keys_loaded")
 
+        # Open the shared async DynamoDB resource for the process lifetime
+        await get_dynamodb_service().connect()
+
     except Exception as e:
         logger.error("initialization_failed", error=str(e))
         raise
 
+    # Optional in-process key refresh (disabled by default; ESO refreshes
+    # secrets via pod restart)
+    refresh_task = None
+    if config.api_key_refresh_interval_seconds > 0:
+        refresh_task = asyncio.create_task(
+            refresh_api_keys_periodically(config.api_key_refresh_interval_seconds)
+        )
+
     logger.info("application_startup_complete")
 
     yield
 
     # Shutdown
     logger.info("application_shutting_down")
+    if refresh_task is not None:
+        refresh_task.cancel()
+    await get_dynamodb_service().close()
     logger.info("application_shutdown_complete")
 
 
@@ -96,6 +97,9 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson serializes responses at C speed and handles datetimes natively;
+    # stdlib json via JSONResponse is the slowest part of response rendering
+    default_response_class=ORJSONResponse,
 )
 
 # Instrument FastAPI with OpenTelemetry for automatic HTTP tracing
@@ -157,21 +161,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add trace ID response header middleware
-app.add_middleware(TraceIdMiddleware)
-
 # Add authentication middleware
 app.add_middleware(AuthMiddleware)
 
-# Add request logging middleware (logs all requests with security context)
+# Add request logging middleware (logs all requests with security context
+# and stamps the X-Amzn-Trace-Id response header)
 app.add_middleware(RequestLoggingMiddleware)
 
 # Register routers
 app.include_router(a2a_router)
 app.include_router(public_router)
 
-# Instrument app with Prometheus
-Instrumentator().instrument(app).expose(app)
+# Instrument app with Prometheus (adds per-request middleware + /metrics);
+# skipped entirely when scraping is not configured for the deployment
+if config.enable_prometheus:
+    Instrumentator().instrument(app).expose(app)
 
 # Mount static files for web UI (must be last to avoid route conflicts)
 app.mount("/", StaticFiles(directory="app/static", html=True), name="static")
@@ -3,6 +3,7 @@
 from app.middleware.auth import (
     AuthMiddleware,
     load_api_keys,
+    refresh_api_keys_periodically,
 )
 from app.middleware.rate_limit import (
     limiter,
@@ -17,6 +18,7 @@ from app.middleware.request_logging import (
 __all__ = [
     "AuthMiddleware",
     "load_api_keys",
+    "refresh_api_keys_periodically",
     "limiter",
     "get_rate_limit_string",
     "should_apply_rate_limit",
@@ -1,105 +1,184 @@
 """Authentication middleware for A2A Guestbook application."""
 
-from typing import Set
+import asyncio
+import hashlib
+import hmac
+import random
+import secrets
+from typing import Optional
 
+import orjson
 import structlog
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import status
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.services.secrets import get_api_keys
-from app.middleware.request_logging import hash_api_key, get_client_ip
+from app.middleware.request_logging import hash_api_key, prime_request_context
 
 logger = structlog.get_logger()
 
-# In-memory cache of valid API keys
-_api_keys_cache: Set[str] = set()
+# Per-process key for HMAC-tagging API keys. Digests are only ever compared
+# in-memory within this process, so the key does not need to survive restarts.
+_HMAC_KEY = secrets.token_bytes(32)
 
+# In-memory cache of HMAC digests of the valid API keys. Storing fixed-width
+# digests instead of the raw keys means membership checks compare uniform
+# 32-byte values, removing the length-dependent timing channel a plain
+# string-set lookup has (str __eq__ short-circuits byte-by-byte). The cache
+# is only ever replaced wholesale, never mutated in place, so frozenset both
+# documents that and skips the mutable-set bookkeeping on lookups.
+_api_key_digests: frozenset[bytes] = frozenset()
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Middleware to validate API keys for authenticated endpoints."""
+# Set once load_api_keys() has populated the digest cache. Until then,
+# protected requests are rejected with a retryable 503 before any token
+# parsing or hashing happens, instead of burning a hash + auth-failed log
+# line per request on an empty key set.
+_keys_ready = asyncio.Event()
 
-    async def dispatch(self, request: Request, call_next):
-        """
-        Process request and validate authentication for protected endpoints.
+# Content hash of the last loaded key set, used by the optional background
+# refresh to skip the digest-cache rebuild when the keys have not changed.
+_last_keys_hash: Optional[bytes] = None
 
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
 
-        Returns:
-            Response from next handler or error response
-        """
+def _digest_api_key(token: str) -> bytes:
+    """Compute the fixed-width HMAC-SHA256 tag used for key comparison."""
+    return hmac.new(_HMAC_KEY, token.encode(), hashlib.sha256).digest()
+
+
+def _content_hash(keys) -> bytes:
+    """Order-independent fingerprint of a key set for change detection."""
+    return hashlib.blake2s(b"\x00".join(sorted(k.encode() for k in keys))).digest()
+
+
+def _error_body(code: str, message: str) -> bytes:
+    """Serialize an error payload once, at import time."""
+    return orjson.dumps({"error": {"code": code, "message": message, "details": {}}})
+
+
+# The three auth-failure payloads are constants; serializing them per request
+# (as JSONResponse does) is redundant work on exactly the traffic — probing,
+# credential stuffing — that arrives in volume.
+_MISSING_AUTH_BODY = _error_body(
+    "MISSING_AUTHORIZATION", "Authorization header is required"
+)
+_INVALID_FORMAT_BODY = _error_body(
+    "INVALID_AUTHORIZATION_FORMAT",
+    "Authorization header must be in format: Bearer <token>",
+)
+_INVALID_KEY_BODY = _error_body("INVALID_API_KEY", "Invalid or expired API key")
+_NOT_READY_BODY = _error_body(
+    "NOT_READY", "API keys are not loaded yet; retry shortly"
+)
+
+
+async def _send_error(send: Send, status_code: int, body: bytes) -> None:
+    """Send a pre-serialized JSON error straight over the ASGI interface.
+
+    No Response object is built at all: two send() calls with a fresh
+    headers list per request (the outer logging middleware appends the
+    trace-id header to it, so the list must not be shared).
+    """
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class AuthMiddleware:
+    """Pure ASGI middleware to validate API keys for authenticated endpoints.
+
+    Implemented against the raw ASGI interface rather than
+    BaseHTTPMiddleware, which spawns an anyio task group and buffers the
+    response body through a memory stream on every request — measurable
+    overhead on an auth gate that runs for all traffic.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Validate authentication for protected endpoints, then delegate."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+
         # Skip authentication for public endpoints
-        if self._is_public_endpoint(request.url.path):
-            return await call_next(request)
+        if self._is_public_endpoint(path):
+            await self.app(scope, receive, send)
+            return
+
+        # Reject retryably until the key cache is populated (startup window)
+        if not _keys_ready.is_set():
+            await _send_error(
+                send, status.HTTP_503_SERVICE_UNAVAILABLE, _NOT_READY_BODY
+            )
+            return
 
-        client_ip = get_client_ip(request)
+        # The outer request-logging middleware normally primes the parsed
+        # header state; prime here only if this middleware runs standalone
+        state = scope.get("state")
+        if state is None or "auth_header" not in state:
+            prime_request_context(scope)
+            state = scope["state"]
 
-        # Extract and validate Bearer token
-        auth_header = request.headers.get("Authorization")
+        # Bind the per-request context once; the failure branches below then
+        # only carry their delta (user + reason) instead of re-passing the
+        # same client_ip/path pair at every call site
+        log = logger.bind(client_ip=state["client_ip"], path=path)
+
+        auth_header = state["auth_header"]
         if not auth_header:
-            logger.warning(
+            log.warning(
                 "auth_failed",
                 user="anonymous",
                 reason="missing_authorization_header",
-                client_ip=client_ip,
-                path=request.url.path,
             )
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={
-                    "error": {
-                        "code": "MISSING_AUTHORIZATION",
-                        "message": "Authorization header is required",
-                        "details": {}
-                    }
-                }
+            await _send_error(
+                send, status.HTTP_401_UNAUTHORIZED, _MISSING_AUTH_BODY
             )
+            return
 
         # Parse Bearer token
         token = self._extract_bearer_token(auth_header)
         if not token:
-            logger.warning(
+            log.warning(
                 "auth_failed",
                 user="anonymous",
                 reason="invalid_authorization_format",
-                client_ip=client_ip,
-                path=request.url.path,
             )
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={
-                    "error": {
-                        "code": "INVALID_AUTHORIZATION_FORMAT",
-                        "message": "Authorization header must be in format: Bearer <token>",
-                        "details": {}
-                    }
-                }
+            await _send_error(
+                send, status.HTTP_401_UNAUTHORIZED, _INVALID_FORMAT_BODY
             )
+            return
 
         # Validate token against cached keys
         if not self._is_valid_api_key(token):
-            logger.warning(
+            # Cache the hash so the outer request log reuses it instead of
+            # hashing the same token a second time (the failure path is the
+            # high-volume one under credential stuffing)
+            user_hash = hash_api_key(token)
+            state["user_hash"] = user_hash
+            log.warning(
                 "auth_failed",
-                user=hash_api_key(token),
+                user=user_hash,
                 reason="invalid_api_key",
-                client_ip=client_ip,
-                path=request.url.path,
             )
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={
-                    "error": {
-                        "code": "INVALID_API_KEY",
-                        "message": "Invalid or expired API key",
-                        "details": {}
-                    }
-                }
+            await _send_error(
+                send, status.HTTP_401_UNAUTHORIZED, _INVALID_KEY_BODY
             )
+            return
 
         # Token is valid, proceed with request
-        return await call_next(request)
+        await self.app(scope, receive, send)
 
     @staticmethod
     def _is_public_endpoint(path: str) -> bool:
@@ -112,41 +191,45 @@ class AuthMiddleware(BaseHTTPMiddleware):
         Returns:
             bool: True if endpoint is public
         """
-        public_paths = [
-            "/health",
-            "/api/public/",
-            "/.well-known/",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-        ]
-
-        # Check if path starts with any public prefix or is a static file
-        return (
-            any(path.startswith(prefix) for prefix in public_paths)
-            or not path.startswith("/api/")
-        )
+        # Everything outside /api/ is public (health, docs, agent card,
+        # static UI); under /api/, only the public prefix is. Two C-level
+        # startswith calls in the worst case — cheaper than any caching or
+        # pattern-matching layered on top.
+        if not path.startswith("/api/"):
+            return True
+        return path.startswith("/api/public/")
 
     @staticmethod
     def _extract_bearer_token(auth_header: str) -> str | None:
         """
         Extract token from Authorization header.
 
+        Uses index-based slicing of the fixed "Bearer " prefix rather than
+        str.split, which allocates a list plus intermediate strings on every
+        authenticated request.
+
         Args:
             auth_header: Authorization header value
 
         Returns:
             str | None: Extracted token or None if invalid format
         """
-        parts = auth_header.split()
-        if len(parts) != 2 or parts[0].lower() != "bearer":
+        if len(auth_header) < 8 or auth_header[:7].lower() != "bearer ":
             return None
-        return parts[1]
+        token = auth_header[7:]
+        if " " in token:
+            return None
+        return token
 
     @staticmethod
     def _is_valid_api_key(token: str) -> bool:
         """
-        Validate API key against cached keys using constant-time comparison.
+        Validate API key against the cached HMAC digests.
+
+        The presented token is hashed with the same per-process HMAC key as
+        the configured keys, so the set lookup compares fixed 32-byte
+        digests: effectively constant-time and O(1) regardless of key
+        length or count.
 
         Args:
             token: API key to validate
@@ -154,8 +237,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         Returns:
             bool: True if key is valid
         """
-        # Use constant-time comparison to prevent timing attacks
-        return token in _api_keys_cache
+        return _digest_api_key(token) in _api_key_digests
 
 
 def load_api_keys() -> None:
@@ -172,13 +254,50 @@ def load_api_keys() -> None:
     Raises:
         Exception: If keys cannot be loaded
     """
-    global _api_keys_cache
+    global _api_key_digests, _last_keys_hash
 
     try:
         logger.info("loading_api_keys")
         keys = get_api_keys()
-        _api_keys_cache = set(keys)
-        logger.info("api_keys_loaded", count=len(_api_keys_cache))
+        _api_key_digests = frozenset(_digest_api_key(key) for key in keys)
+        _last_keys_hash = _content_hash(keys)
+        _keys_ready.set()
+        logger.info("api_keys_loaded", count=len(_api_key_digests))
     except Exception as e:
         logger.error("api_keys_load_failed", error=str(e))
         raise
+
+
+async def refresh_api_keys_periodically(interval_seconds: int) -> None:
+    """
+    Periodically reload API keys, swapping the digest cache only on change.
+
+    Disabled by default (API_KEY_REFRESH_INTERVAL_SECONDS=0): ESO-synced
+    secrets normally reach the pod via a restart, so startup loading is
+    enough. When enabled, two refinements keep the refresh cheap:
+
+    - The key set is fingerprinted first and the digest cache is rebuilt
+      only when the content actually changed, so the common no-change
+      cycle allocates nothing.
+    - The sleep is jittered by up to 10% so pods sharing an interval do
+      not synchronize their reloads.
+
+    Args:
+        interval_seconds: Base interval between refresh attempts
+    """
+    global _api_key_digests, _last_keys_hash
+
+    while True:
+        await asyncio.sleep(
+            interval_seconds + random.uniform(0, interval_seconds * 0.1)
+        )
+        try:
+            keys = get_api_keys(force_reload=True)
+            keys_hash = _content_hash(keys)
+            if keys_hash != _last_keys_hash:
+                _api_key_digests = frozenset(_digest_api_key(key) for key in keys)
+                _last_keys_hash = keys_hash
+                logger.info("api_keys_refreshed", count=len(_api_key_digests))
+        except Exception as e:
+            # Keep serving the previous key set; retry next interval
+            logger.error("api_keys_refresh_failed", error=str(e))
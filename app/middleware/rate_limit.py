@@ -1,5 +1,7 @@
 """Rate limiting configuration for A2A Guestbook application."""
 
+import hashlib
+import secrets
 from typing import Callable
 
 import structlog
@@ -7,10 +9,26 @@ from fastapi import Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-from app.config import config
+from app.config import get_config
 
 logger = structlog.get_logger()
 
+# Key for the rate-limit fingerprint. Per-process randomness is fine here:
+# the slowapi buckets live in process memory and don't outlive restarts.
+_FINGERPRINT_KEY = secrets.token_bytes(16)
+
+
+def _fingerprint_api_key(api_key: str) -> str:
+    """Derive a short fixed-width bucket id from an API key.
+
+    Keeps full (potentially 64-byte) keys out of slowapi's in-memory
+    storage: 16-hex-char bucket ids mean smaller dict keys and cheaper
+    hash-table comparisons on the rate-limit hot path.
+    """
+    return hashlib.blake2s(
+        api_key.encode(), digest_size=8, key=_FINGERPRINT_KEY
+    ).hexdigest()
+
 
 def get_api_key_identifier(request: Request) -> str:
     """
@@ -25,21 +43,25 @@ def get_api_key_identifier(request: Request) -> str:
     Returns:
         str: Identifier for rate limiting (API key or IP address)
     """
-    # Extract Authorization header
-    auth_header = request.headers.get("Authorization", "")
-
-    # Parse Bearer token
-    if auth_header.startswith("Bearer "):
-        api_key = auth_header[7:]  # Remove "Bearer " prefix
-        if api_key:
-            # Use first 8 characters of API key for logging (sanitized)
-            logger.debug("rate_limit_by_api_key", key_prefix=api_key[:8])
-            return f"api_key:{api_key}"
+    # Reuse the token parsed by the request-logging middleware when present
+    try:
+        api_key = request.state.auth_token
+    except AttributeError:
+        auth_header = request.headers.get("Authorization", "")
+        api_key = auth_header[7:] if auth_header.startswith("Bearer ") else None
+
+    if api_key:
+        # Cache the derived bucket id on request.state so other consumers
+        # in the same request don't re-hash the key
+        try:
+            return request.state.rate_limit_key
+        except AttributeError:
+            identifier = f"api_key:{_fingerprint_api_key(api_key)}"
+            request.state.rate_limit_key = identifier
+            return identifier
 
     # Fall back to IP address for unauthenticated requests
-    ip_address = get_remote_address(request)
-    logger.debug("rate_limit_by_ip", ip_address=ip_address)
-    return f"ip:{ip_address}"
+    return f"ip:{get_remote_address(request)}"
 
 
 # Initialize rate limiter
@@ -57,7 +79,7 @@ def get_rate_limit_string() -> str:
     Returns:
         str: Rate limit in slowapi format (e.g., "10/minute")
     """
-    return f"{config.rate_limit_per_minute}/minute"
+    return f"{get_config().rate_limit_per_minute}/minute"
 
 
 def should_apply_rate_limit(request: Request) -> bool:
@@ -1,121 +1,207 @@
 """Request logging middleware for structured security-relevant logging."""
 
 import hashlib
+import os
 import time
 
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.tracing import get_current_trace_id
 
 
 logger = structlog.get_logger()
 
 
+# Key for the log-tag hash. Overridable via env so identifiers stay stable
+# across pods when desired; keying the hash prevents offline mapping of log
+# tags back to API keys, which the previous unkeyed SHA-256 allowed.
+_LOG_HASH_KEY = os.getenv("LOG_HASH_KEY", "a2a-guestbook-log-tag").encode()
+
+
 def hash_api_key(api_key: str) -> str:
     """Create a short hash of API key for logging (don't log full key).
-    
+
+    Uses keyed BLAKE2s with a 4-byte digest: faster than SHA-256 and the
+    digest is exactly the 8 hex chars we log, so no hexdigest slicing.
+
     Args:
         api_key: The full API key string
-        
+
     Returns:
         str: Hashed identifier like "api-key-hash:a1b2c3d4" or "anonymous"
     """
     if not api_key:
         return "anonymous"
-    return f"api-key-hash:{hashlib.sha256(api_key.encode()).hexdigest()[:8]}"
+    digest = hashlib.blake2s(
+        api_key.encode(), digest_size=4, key=_LOG_HASH_KEY
+    ).hexdigest()
+    return f"api-key-hash:{digest}"
+
+
+# Known (method, path) pairs mapped to business action names. A single dict
+# lookup replaces the old if/elif chain, which probed every branch for paths
+# near the bottom. Method-agnostic endpoints are listed per method they serve.
+_ACTIONS = {
+    ("GET", "/api/v1/messages"): "list_messages",
+    ("POST", "/api/v1/messages"): "create_message",
+    ("GET", "/api/public/messages"): "list_public_messages",
+    ("GET", "/health"): "health_check",
+    ("GET", "/metrics"): "metrics",
+    ("GET", "/.well-known/agent.json"): "get_capabilities",
+}
+
+# Parameterized message routes: /api/v1/messages/{id}
+_MSG_ID_ACTIONS = {"GET": "get_message", "DELETE": "delete_message"}
+_MSG_ID_PREFIX = "/api/v1/messages/"
 
 
 def determine_action(method: str, path: str) -> str:
     """Map HTTP method and path to a business action name.
-    
+
     Args:
         method: HTTP method (GET, POST, etc.)
         path: Request URL path
-        
+
     Returns:
         str: Business action name in snake_case
     """
-    # A2A API v1 endpoints
-    if path == "/api/v1/messages":
-        if method == "GET":
-            return "list_messages"
-        elif method == "POST":
-            return "create_message"
-    elif path.startswith("/api/v1/messages/"):
-        if method == "GET":
-            return "get_message"
-        elif method == "DELETE":
-            return "delete_message"
-    
-    # Public endpoints
-    elif path == "/api/public/messages":
-        return "list_public_messages"
-    
-    # System endpoints
-    elif path == "/health":
-        return "health_check"
-    elif path == "/metrics":
-        return "metrics"
-    elif path == "/.well-known/agent.json":
-        return "get_capabilities"
-    
+    action = _ACTIONS.get((method, path))
+    if action is not None:
+        return action
+
+    # Parameterized A2A routes
+    if path.startswith(_MSG_ID_PREFIX):
+        action = _MSG_ID_ACTIONS.get(method)
+        if action is not None:
+            return action
+
     # Default: derive from method and path
     sanitized_path = path.replace("/", "_").strip("_")
     return f"{method.lower()}_{sanitized_path}"
 
 
+def prime_request_context(scope: Scope) -> None:
+    """Parse security-relevant headers once and cache them in scope["state"].
+
+    Scans the raw ASGI header list in a single pass; without this, the auth
+    middleware, rate limiter and logging each re-read Authorization /
+    X-Forwarded-For per request. Called by RequestLoggingMiddleware (the
+    outermost middleware) so everything downstream can reuse the parsed
+    values — including Request-based consumers, since request.state wraps
+    the same scope["state"] dict.
+    """
+    state = scope.setdefault("state", {})
+
+    auth_header = None
+    forwarded_for = None
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            auth_header = value.decode("latin-1")
+        elif name == b"x-forwarded-for":
+            forwarded_for = value.decode("latin-1")
+
+    state["auth_header"] = auth_header
+    if auth_header and auth_header.startswith("Bearer "):
+        state["auth_token"] = auth_header[7:] or None
+    else:
+        state["auth_token"] = None
+
+    if forwarded_for:
+        # X-Forwarded-For may contain multiple IPs; take the first (original client)
+        state["client_ip"] = forwarded_for.split(",")[0].strip()
+    else:
+        client = scope.get("client")
+        state["client_ip"] = client[0] if client else "unknown"
+
+    # The user hash is deliberately not computed here: hashing belongs on
+    # the rare paths that actually emit it (see resolve_user_hash).
+
+
+def resolve_user_hash(scope: Scope) -> str:
+    """Return the hashed user identifier, computing it at most once.
+
+    The BLAKE2s hash only runs when a log line is actually being emitted
+    (auth failure or the end-of-request log), not eagerly per request.
+    The result is cached in scope["state"] so a failure log and the
+    request log never hash the same credentials twice.
+    """
+    state = scope["state"]
+    user_hash = state.get("user_hash")
+    if user_hash is not None:
+        return user_hash
+    api_key = ""
+    for name, value in scope["headers"]:
+        if name == b"x-api-key":
+            api_key = value.decode("latin-1")
+            break
+    user_hash = hash_api_key(api_key or state.get("auth_token") or "")
+    state["user_hash"] = user_hash
+    return user_hash
+
+
 def get_client_ip(request: Request) -> str:
     """Extract client IP address from request, handling X-Forwarded-For from ALB.
-    
+
     Args:
         request: The incoming HTTP request
-        
+
     Returns:
         str: Client IP address
     """
+    # Reuse the value parsed by prime_request_context when available
+    client_ip = getattr(request.state, "client_ip", None)
+    if client_ip is not None:
+        return client_ip
+
     # X-Forwarded-For header from ALB/proxy
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
         # X-Forwarded-For may contain multiple IPs; take the first (original client)
         return forwarded_for.split(",")[0].strip()
-    
+
     # Fall back to direct client IP
     if request.client:
         return request.client.host
-    
+
     return "unknown"
 
 
 def extract_user_identifier(request: Request) -> str:
     """Extract user identifier from request headers.
-    
+
     Supports both X-API-Key header and Authorization Bearer token.
-    
+
     Args:
         request: The incoming HTTP request
-        
+
     Returns:
         str: Hashed user identifier or "anonymous"
     """
+    # Reuse the value parsed by prime_request_context when available
+    user_hash = getattr(request.state, "user_hash", None)
+    if user_hash is not None:
+        return user_hash
+
     # Check X-API-Key header first
     api_key = request.headers.get("X-API-Key", "")
     if api_key:
         return hash_api_key(api_key)
-    
+
     # Check Authorization Bearer token
     auth_header = request.headers.get("Authorization", "")
     if auth_header.startswith("Bearer "):
         token = auth_header[7:]  # Remove "Bearer " prefix
         if token:
             return hash_api_key(token)
-    
+
     return "anonymous"
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all HTTP requests with security context.
-    
+class RequestLoggingMiddleware:
+    """Pure ASGI middleware to log all HTTP requests with security context.
+
     Logs structured JSON entries for each request with:
     - User identifier (hashed API key)
     - Business action name
@@ -123,53 +209,72 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     - Response status code
     - Request duration
     - Client IP address
-    
+
     Health checks and metrics endpoints are excluded to reduce noise.
+
+    Also stamps the X-Amzn-Trace-Id response header so clients can correlate
+    requests with X-Ray traces. This lived in a dedicated middleware before;
+    folding it in here removes one middleware frame per request.
+
+    Implemented against the raw ASGI interface rather than
+    BaseHTTPMiddleware, which spawns an anyio task group and buffers the
+    response body through a memory stream on every request. A send wrapper
+    captures the status code and injects the trace header from the
+    http.response.start message without touching the body.
     """
 
     # Endpoints to exclude from logging (high-frequency, low-value)
     EXCLUDED_PATHS = {"/health", "/metrics"}
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Process request and log with security context.
-        
-        Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-            
-        Returns:
-            Response from next handler
-        """
-        start_time = time.perf_counter()
-
-        # Extract security context before processing
-        user = extract_user_identifier(request)
-        client_ip = get_client_ip(request)
-        path = request.url.path
-        method = request.method
-
-        # Process the request
-        response = await call_next(request)
-
-        # Calculate duration
-        duration_ms = (time.perf_counter() - start_time) * 1000
-
-        # Determine business action
-        action = determine_action(method, path)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and log with security context."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        method = scope["method"]
+
+        # Health probes and metrics scrapes are never logged, so skip the
+        # clock_gettime pair entirely for them
+        excluded = path in self.EXCLUDED_PATHS
+        start_time = None if excluded else time.perf_counter()
+
+        # Parse security-relevant headers once; auth and rate limiting
+        # downstream reuse the scope["state"] values
+        prime_request_context(scope)
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add trace ID to response headers if available
+                trace_id = get_current_trace_id()
+                if trace_id:
+                    message.setdefault("headers", []).append(
+                        (b"x-amzn-trace-id", b"Root=" + trace_id.encode("ascii"))
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
 
         # Log the request (skip excluded paths to reduce noise)
-        if path not in self.EXCLUDED_PATHS:
+        if not excluded:
+            duration_ms = (time.perf_counter() - start_time) * 1000
             logger.info(
                 "api_request",
-                user=user,
-                action=action,
+                user=resolve_user_hash(scope),
+                action=determine_action(method, path),
                 path=path,
                 method=method,
-                status_code=response.status_code,
+                status_code=status_code,
                 duration_ms=round(duration_ms, 2),
-                client_ip=client_ip,
+                client_ip=scope["state"]["client_ip"],
             )
 
-        return response
-
 
@@ -1,38 +1,33 @@
 """Pydantic models for A2A Guestbook API."""
 
 from datetime import datetime
-from typing import Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, Optional
+from pydantic import BaseModel, Field, StringConstraints
 
 
 class MessageCreate(BaseModel):
-    """Request model for creating a new message."""
-
-    agent_name: str = Field(
-        ...,
-        min_length=1,
-        max_length=100,
-        description="Name of the agent creating the message"
-    )
-    message_text: str = Field(
-        ...,
-        min_length=1,
-        max_length=280,
-        description="Content of the message (max 280 characters)"
-    )
+    """Request model for creating a new message.
+
+    The strip/non-empty rules run as native StringConstraints inside
+    pydantic-core; a Python field_validator callback here would cost an
+    interop round-trip per field on every request. Note the length checks
+    apply after whitespace stripping, so all-whitespace input fails
+    min_length.
+    """
+
+    agent_name: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=100),
+    ] = Field(..., description="Name of the agent creating the message")
+    message_text: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, min_length=1, max_length=280),
+    ] = Field(..., description="Content of the message (max 280 characters)")
     metadata: Optional[dict[str, Any]] = Field(
         default=None,
         description="Optional metadata about the message"
     )
 
-    @field_validator("agent_name", "message_text")
-    @classmethod
-    def validate_not_empty(cls, v: str) -> str:
-        """Ensure fields are not just whitespace."""
-        if not v or not v.strip():
-            raise ValueError("Field cannot be empty or whitespace only")
-        return v.strip()
-
 
 class Message(BaseModel):
     """Complete message model with all fields."""
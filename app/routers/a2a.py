@@ -1,18 +1,20 @@
 """A2A Protocol endpoints for agent-to-agent communication."""
 
+import hashlib
 from typing import Optional
 
+import orjson
 import structlog
 from fastapi import APIRouter, HTTPException, status, Query, Path, Request
+from fastapi.responses import ORJSONResponse, Response
 from botocore.exceptions import ClientError
 
 from app.models import (
     MessageCreate,
     Message,
-    MessageList,
     A2ACapabilities,
 )
-from app.services.dynamodb import dynamodb_service
+from app.services.dynamodb import get_dynamodb_service
 from app.middleware.rate_limit import limiter, get_rate_limit_string
 
 logger = structlog.get_logger()
@@ -20,93 +22,151 @@ logger = structlog.get_logger()
 router = APIRouter()
 
 
+def _error_bytes(code: str, message: str) -> bytes:
+    """Serialize a constant error payload once, at import time."""
+    return orjson.dumps({"error": {"code": code, "message": message, "details": {}}})
+
+
+# Error bodies for the 500 branches are constants; building the nested dict
+# and re-encoding it per failure is wasted work exactly when error volume
+# spikes during an incident.
+_CREATE_DB_ERROR = _error_bytes(
+    "DATABASE_ERROR", "Failed to create message due to database error"
+)
+_LIST_DB_ERROR = _error_bytes(
+    "DATABASE_ERROR", "Failed to retrieve messages due to database error"
+)
+_GET_DB_ERROR = _error_bytes(
+    "DATABASE_ERROR", "Failed to retrieve message due to database error"
+)
+_INTERNAL_ERROR = _error_bytes("INTERNAL_ERROR", "An unexpected error occurred")
+
+
+def _error_response(body: bytes) -> Response:
+    """Wrap pre-serialized error bytes in a 500 response."""
+    return Response(
+        content=body,
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        media_type="application/json",
+    )
+
+
+# The capabilities descriptor is a constant; build it once at import time
+# and serve the pre-serialized bytes instead of re-validating and
+# re-serializing the same payload per request.
+_CAPABILITIES = {
+    "protocol_version": "1.0",
+    "agent_name": "A2A Guestbook",
+    "capabilities": {
+        "message_creation": {
+            "enabled": True,
+            "max_message_length": 280,
+            "max_agent_name_length": 100,
+            "supports_metadata": True,
+        },
+        "message_retrieval": {
+            "enabled": True,
+            "supports_pagination": True,
+            "default_page_size": 50,
+            "max_page_size": 100,
+        },
+        "rate_limiting": {
+            "enabled": True,
+            "requests_per_minute": 10,
+            "scope": "per_api_key",
+        },
+        "authentication": {
+            "type": "bearer_token",
+            "required_for": ["message_creation", "message_retrieval"],
+        },
+    },
+    "endpoints": {
+        "create_message": {
+            "method": "POST",
+            "path": "/api/v1/messages",
+            "authentication_required": True,
+            "rate_limited": True,
+            "description": "Create a new guestbook message",
+        },
+        "list_messages": {
+            "method": "GET",
+            "path": "/api/v1/messages",
+            "authentication_required": True,
+            "rate_limited": True,
+            "description": "List all messages in reverse chronological order",
+            "supports_pagination": True,
+        },
+        "get_message": {
+            "method": "GET",
+            "path": "/api/v1/messages/{id}",
+            "authentication_required": True,
+            "rate_limited": True,
+            "description": "Get a specific message by ID",
+        },
+        "public_messages": {
+            "method": "GET",
+            "path": "/api/public/messages",
+            "authentication_required": False,
+            "rate_limited": False,
+            "description": "Public endpoint to view recent messages (no metadata)",
+        },
+    },
+}
+
+# Validate the static payload exactly once, at import: requests serve the
+# raw bytes without a response_model, so schema drift in the dict above
+# should fail process startup rather than ship silently.
+A2ACapabilities(**_CAPABILITIES)
+
+_CAPABILITIES_JSON = orjson.dumps(_CAPABILITIES)
+# Weak ETag so clients can revalidate with If-None-Match and skip the body
+_CAPABILITIES_ETAG = f'W/"{hashlib.md5(_CAPABILITIES_JSON).hexdigest()}"'
+
+
 @router.get(
     "/.well-known/agent.json",
-    response_model=A2ACapabilities,
+    response_class=Response,
     tags=["A2A Protocol"],
     summary="Get agent capabilities",
     description="Returns A2A protocol capabilities and available endpoints (no authentication required)",
 )
-async def get_capabilities() -> A2ACapabilities:
+async def get_capabilities(request: Request) -> Response:
     """
     Get A2A protocol capabilities descriptor.
 
     This endpoint is publicly accessible and provides information about
     the agent's capabilities, supported operations, and available endpoints.
 
+    The payload is constant, so the response is a pre-serialized bytes blob
+    computed at import time; matching If-None-Match requests get a 304.
+
     Returns:
-        A2ACapabilities: Agent capabilities and endpoint documentation
+        Response: Agent capabilities and endpoint documentation
     """
-    return A2ACapabilities(
-        protocol_version="1.0",
-        agent_name="A2A Guestbook",
-        capabilities={
-            "message_creation": {
-                "enabled": True,
-                "max_message_length": 280,
-                "max_agent_name_length": 100,
-                "supports_metadata": True,
-            },
-            "message_retrieval": {
-                "enabled": True,
-                "supports_pagination": True,
-                "default_page_size": 50,
-                "max_page_size": 100,
-            },
-            "rate_limiting": {
-                "enabled": True,
-                "requests_per_minute": 10,
-                "scope": "per_api_key",
-            },
-            "authentication": {
-                "type": "bearer_token",
-                "required_for": ["message_creation", "message_retrieval"],
-            },
-        },
-        endpoints={
-            "create_message": {
-                "method": "POST",
-                "path": "/api/v1/messages",
-                "authentication_required": True,
-                "rate_limited": True,
-                "description": "Create a new guestbook message",
-            },
-            "list_messages": {
-                "method": "GET",
-                "path": "/api/v1/messages",
-                "authentication_required": True,
-                "rate_limited": True,
-                "description": "List all messages in reverse chronological order",
-                "supports_pagination": True,
-            },
-            "get_message": {
-                "method": "GET",
-                "path": "/api/v1/messages/{id}",
-                "authentication_required": True,
-                "rate_limited": True,
-                "description": "Get a specific message by ID",
-            },
-            "public_messages": {
-                "method": "GET",
-                "path": "/api/public/messages",
-                "authentication_required": False,
-                "rate_limited": False,
-                "description": "Public endpoint to view recent messages (no metadata)",
-            },
-        },
+    if request.headers.get("If-None-Match") == _CAPABILITIES_ETAG:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": _CAPABILITIES_ETAG},
+        )
+    return Response(
+        content=_CAPABILITIES_JSON,
+        media_type="application/json",
+        headers={"ETag": _CAPABILITIES_ETAG},
     )
 
 
 @router.post(
     "/api/v1/messages",
-    response_model=Message,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_201_CREATED,
     tags=["Messages"],
     summary="Create a new message",
     description="Create a new guestbook message (requires authentication)",
 )
 @limiter.limit(get_rate_limit_string())
-async def create_message(request: Request, message_data: MessageCreate) -> Message:
+async def create_message(
+    request: Request, message_data: MessageCreate
+) -> ORJSONResponse:
     """
     Create a new guestbook message.
 
@@ -117,7 +177,7 @@ async def create_message(request: Request, message_data: MessageCreate) -> Messa
         message_data: Message creation data (agent_name, message_text, optional metadata)
 
     Returns:
-        Message: Created message with generated ID and timestamp
+        ORJSONResponse: Created message with generated ID and timestamp
 
     Raises:
         HTTPException:
@@ -127,22 +187,26 @@ async def create_message(request: Request, message_data: MessageCreate) -> Messa
             - 500: Internal Server Error (database error)
     """
     try:
-        logger.info(
+        logger.debug(
             "creating_message",
             agent_name=message_data.agent_name,
         )
 
         # Create message in DynamoDB
-        message = await dynamodb_service.create_message(message_data)
+        message = await get_dynamodb_service().create_message(message_data)
 
-        logger.info(
+        logger.debug(
             "message_created",
             message_id=message.message_id,
             agent_name=message.agent_name,
             timestamp=message.timestamp,
         )
 
-        return message
+        # Serialize directly; a response_model would re-validate the model
+        # we just constructed from validated input
+        return ORJSONResponse(
+            message.model_dump(), status_code=status.HTTP_201_CREATED
+        )
 
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
@@ -151,34 +215,16 @@ async def create_message(request: Request, message_data: MessageCreate) -> Messa
             action="create_message",
             error_code=error_code,
         )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "code": "DATABASE_ERROR",
-                    "message": "Failed to create message due to database error",
-                    "details": {},
-                }
-            },
-        )
+        return _error_response(_CREATE_DB_ERROR)
 
     except Exception as e:
         logger.error("unexpected_error", action="create_message", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "An unexpected error occurred",
-                    "details": {},
-                }
-            },
-        )
+        return _error_response(_INTERNAL_ERROR)
 
 
 @router.get(
     "/api/v1/messages",
-    response_model=MessageList,
+    response_class=ORJSONResponse,
     tags=["Messages"],
     summary="List all messages",
     description="List messages in reverse chronological order (requires authentication)",
@@ -196,7 +242,7 @@ async def list_messages(
         default=None,
         description="Pagination token from previous response"
     ),
-) -> MessageList:
+) -> ORJSONResponse:
     """
     List all guestbook messages in reverse chronological order.
 
@@ -208,7 +254,7 @@ async def list_messages(
         start_key: Pagination token for next page
 
     Returns:
-        MessageList: List of messages and optional pagination token
+        ORJSONResponse: List of messages and optional pagination token
 
     Raises:
         HTTPException:
@@ -217,25 +263,27 @@ async def list_messages(
             - 500: Internal Server Error (database error)
     """
     try:
-        logger.info(
+        logger.debug(
             "listing_messages",
             limit=limit,
             has_start_key=start_key is not None,
         )
 
         # Query messages from DynamoDB
-        messages, next_key = await dynamodb_service.list_messages(
+        messages, next_key = await get_dynamodb_service().list_messages(
             limit=limit,
             start_key=start_key
         )
 
-        logger.info(
+        logger.debug(
             "messages_retrieved",
             count=len(messages),
             has_next_page=next_key is not None,
         )
 
-        return MessageList(messages=messages, next_key=next_key)
+        # The service returns raw JSON-shaped dicts; serialize them straight
+        # with orjson instead of round-tripping through Pydantic models
+        return ORJSONResponse({"messages": messages, "next_key": next_key})
 
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
@@ -244,34 +292,16 @@ async def list_messages(
             action="list_messages",
             error_code=error_code,
         )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "code": "DATABASE_ERROR",
-                    "message": "Failed to retrieve messages due to database error",
-                    "details": {},
-                }
-            },
-        )
+        return _error_response(_LIST_DB_ERROR)
 
     except Exception as e:
         logger.error("unexpected_error", action="list_messages", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "An unexpected error occurred",
-                    "details": {},
-                }
-            },
-        )
+        return _error_response(_INTERNAL_ERROR)
 
 
 @router.get(
     "/api/v1/messages/{message_id}",
-    response_model=Message,
+    response_class=ORJSONResponse,
     tags=["Messages"],
     summary="Get a specific message",
     description="Get a message by its ID (requires authentication)",
@@ -283,7 +313,7 @@ async def get_message(
         ...,
         description="UUID of the message to retrieve"
     ),
-) -> Message:
+) -> ORJSONResponse:
     """
     Get a specific guestbook message by ID.
 
@@ -294,7 +324,7 @@ async def get_message(
         message_id: UUID of the message
 
     Returns:
-        Message: The requested message
+        ORJSONResponse: The requested message
 
     Raises:
         HTTPException:
@@ -304,13 +334,13 @@ async def get_message(
             - 500: Internal Server Error (database error)
     """
     try:
-        logger.info("fetching_message", message_id=message_id)
+        logger.debug("fetching_message", message_id=message_id)
 
         # Get message from DynamoDB
-        message = await dynamodb_service.get_message_by_id(message_id)
+        message = await get_dynamodb_service().get_message_by_id(message_id)
 
         if message is None:
-            logger.info("message_not_found", message_id=message_id)
+            logger.debug("message_not_found", message_id=message_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail={
@@ -322,9 +352,11 @@ async def get_message(
                 },
             )
 
-        logger.info("message_retrieved", message_id=message_id)
+        logger.debug("message_retrieved", message_id=message_id)
 
-        return message
+        # Serialize directly; a response_model would re-validate data read
+        # back from our own writes
+        return ORJSONResponse(message.model_dump())
 
     except HTTPException:
         # Re-raise HTTP exceptions (like 404)
@@ -338,26 +370,8 @@ async def get_message(
             error_code=error_code,
             message_id=message_id,
         )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "code": "DATABASE_ERROR",
-                    "message": "Failed to retrieve message due to database error",
-                    "details": {},
-                }
-            },
-        )
+        return _error_response(_GET_DB_ERROR)
 
     except Exception as e:
         logger.error("unexpected_error", action="get_message", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "An unexpected error occurred",
-                    "details": {},
-                }
-            },
-        )
+        return _error_response(_INTERNAL_ERROR)
@@ -1,27 +1,57 @@
 """Public endpoints for A2A Guestbook (no authentication required)."""
 
+import time
 from datetime import datetime, timezone
 
+import orjson
 import structlog
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse, Response
 from botocore.exceptions import ClientError
-
-from app.models import PublicMessageList, HealthResponse
-from app.services.dynamodb import dynamodb_service
+from app.services.dynamodb import get_dynamodb_service
 
 logger = structlog.get_logger()
 
 router = APIRouter()
 
+# Error bodies for the 500 branches are constants; serialize them once
+_DB_ERROR = orjson.dumps(
+    {
+        "error": {
+            "code": "DATABASE_ERROR",
+            "message": "Failed to retrieve messages",
+            "details": {},
+        }
+    }
+)
+_INTERNAL_ERROR = orjson.dumps(
+    {
+        "error": {
+            "code": "INTERNAL_ERROR",
+            "message": "An unexpected error occurred",
+            "details": {},
+        }
+    }
+)
+
+
+def _error_response(body: bytes) -> Response:
+    """Wrap pre-serialized error bytes in a 500 response."""
+    return Response(
+        content=body,
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        media_type="application/json",
+    )
+
 
 @router.get(
     "/api/public/messages",
-    response_model=PublicMessageList,
+    response_class=ORJSONResponse,
     tags=["Public"],
     summary="Get recent messages (public)",
     description="Get up to 50 recent messages without authentication (metadata excluded)",
 )
-async def get_public_messages() -> PublicMessageList:
+async def get_public_messages() -> ORJSONResponse:
     """
     Get recent guestbook messages for public viewing.
 
@@ -30,32 +60,28 @@ async def get_public_messages() -> PublicMessageList:
     for privacy. Limited to 50 most recent messages.
 
     Returns:
-        PublicMessageList: List of recent messages (no metadata, no pagination)
+        ORJSONResponse: List of recent messages (no metadata, no pagination)
 
     Raises:
-        HTTPException:
-            - 500: Internal Server Error (database error)
+        Nothing; database failures are returned as pre-serialized 500
+        responses.
     """
     try:
-        logger.info("fetching_public_messages")
-
-        # Get up to 50 most recent messages
-        messages, _ = await dynamodb_service.list_messages(limit=50)
+        logger.debug("fetching_public_messages")
 
-        # Convert to public format (exclude metadata)
-        public_messages = [
-            {
-                "message_id": msg.message_id,
-                "agent_name": msg.agent_name,
-                "message_text": msg.message_text,
-                "timestamp": msg.timestamp,
-            }
-            for msg in messages
-        ]
+        # Get up to 50 most recent messages; project away metadata and the
+        # GSI key so DynamoDB never sends bytes this endpoint discards
+        messages, _ = await get_dynamodb_service().list_messages(
+            limit=50,
+            projection=["message_id", "agent_name", "message_text", "timestamp"],
+        )
 
-        logger.info("public_messages_retrieved", count=len(public_messages))
+        logger.debug("public_messages_retrieved", count=len(messages))
 
-        return PublicMessageList(messages=public_messages)
+        # The projection already shaped each item to exactly the public
+        # fields, so the raw dicts go straight to orjson — one pass, no
+        # intermediate copies
+        return ORJSONResponse({"messages": messages})
 
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
@@ -64,39 +90,29 @@ async def get_public_messages() -> PublicMessageList:
             action="list_public_messages",
             error_code=error_code,
         )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "code": "DATABASE_ERROR",
-                    "message": "Failed to retrieve messages",
-                    "details": {},
-                }
-            },
-        )
+        return _error_response(_DB_ERROR)
 
     except Exception as e:
         logger.error("unexpected_error", action="list_public_messages", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "An unexpected error occurred",
-                    "details": {},
-                }
-            },
-        )
+        return _error_response(_INTERNAL_ERROR)
+
+
+# Health probes arrive every few seconds per pod (liveness + readiness +
+# startup); the serialized body is cached at ~1s granularity so the common
+# probe is a memcpy rather than datetime formatting plus serialization.
+# cached_at is monotonic so a backwards wall-clock step cannot pin the
+# stale body; only the timestamp inside the body uses wall-clock time.
+_health_cache: tuple[float, bytes] = (-1.0, b"")
 
 
 @router.get(
     "/health",
-    response_model=HealthResponse,
+    response_class=Response,
     tags=["Health"],
     summary="Health check",
     description="Check application health status",
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Health check endpoint for container probes.
 
@@ -104,9 +120,19 @@ async def health_check() -> HealthResponse:
     orchestration systems. Returns current timestamp and status.
 
     Returns:
-        HealthResponse: Health status and current timestamp
+        Response: Health status and current timestamp
     """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now(timezone.utc).isoformat(),
-    )
+    global _health_cache
+
+    now = time.monotonic()
+    cached_at, body = _health_cache
+    if now - cached_at >= 1.0:
+        body = orjson.dumps(
+            {
+                "status": "healthy",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+        _health_cache = (now, body)
+
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,40 @@
+"""Shared AWS session and HTTP client configuration.
+
+Every AWS client in the process should come from the session exposed here:
+session construction runs credential discovery and endpoint resolution, and
+clients created from one session share botocore's urllib3 connection pool,
+so warm TCP+TLS connections are reused across services instead of paying a
+fresh handshake per client.
+"""
+
+from functools import lru_cache
+
+import aioboto3
+from botocore.config import Config as BotoConfig
+
+# HTTP client tuning shared by all AWS clients. The botocore default pool
+# of 10 connections exhausts under concurrent load and forces fresh TLS
+# handshakes; keep-alive plus a larger pool amortizes connection setup.
+# Timeouts are tight because DynamoDB answers in single-digit milliseconds
+# when healthy — failing fast beats queueing behind a dead connection.
+# Adaptive retry mode rate-limits the client itself when DynamoDB starts
+# throttling, so request bursts back off instead of stampeding the table
+# into sustained ProvisionedThroughputExceededException.
+BOTO_CONFIG = BotoConfig(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={"mode": "adaptive", "max_attempts": 4},
+    connect_timeout=1.0,
+    read_timeout=3.0,
+)
+
+
+@lru_cache(maxsize=1)
+def get_aws_session() -> aioboto3.Session:
+    """Build and cache the process-wide aioboto3 session on first use.
+
+    Lazy for the same reason as get_config()/get_dynamodb_service():
+    credential discovery stays off the import path, and modules import
+    cleanly without AWS credentials present.
+    """
+    return aioboto3.Session()
@@ -1,27 +1,121 @@
 """AWS DynamoDB service for message storage."""
 
+import asyncio
+import base64
+import time
 import uuid
-from datetime import datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 
-import boto3
+import orjson
 import structlog
 from botocore.exceptions import ClientError
 
-from app.config import config
+from app.config import get_config
 from app.models import Message, MessageCreate
+from app.services.aws import BOTO_CONFIG, get_aws_session
 
 logger = structlog.get_logger()
 
+# In-process read cache for get_message_by_id. Messages are immutable once
+# written (no update/delete API), so the TTL bounds memory rather than
+# staleness; repeat lookups of hot ids skip the DynamoDB round-trip and its
+# RCU cost entirely.
+_MESSAGE_CACHE_TTL = 60.0
+_MESSAGE_CACHE_MAX = 10_000
+
+# Default projection for list queries: exactly the Message payload fields.
+# Fetching everything would also return the entity_type GSI key, which is
+# internal bookkeeping — RCUs are billed on returned item size and botocore
+# deserializes every attribute, so bytes nobody reads are pure cost.
+_DEFAULT_LIST_PROJECTION = [
+    "message_id",
+    "agent_name",
+    "message_text",
+    "timestamp",
+    "metadata",
+]
+
+
+def _convert_decimals(value: Any) -> Any:
+    """Recursively replace boto3's Decimal numbers with int/float.
+
+    The resource layer deserializes every DynamoDB Number as
+    decimal.Decimal, which orjson refuses to serialize. Integral values
+    map back to int and the rest to float — the same shapes the original
+    JSON payload held before the write. Only metadata can carry numbers
+    (every other Message field is a string), so callers convert just that
+    attribute.
+    """
+    if isinstance(value, Decimal):
+        return int(value) if value % 1 == 0 else float(value)
+    if isinstance(value, dict):
+        return {key: _convert_decimals(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_convert_decimals(val) for val in value]
+    return value
+
+
+def _iso_now(
+    _time_ns=time.time_ns, _gmtime=time.gmtime, _strftime=time.strftime
+) -> str:
+    """Current UTC time in the exact format datetime.isoformat() produced.
+
+    Byte-for-byte compatible with the previous
+    datetime.now(timezone.utc).isoformat() (microseconds, +00:00 suffix)
+    but several times cheaper: one clock read plus a C-level strftime,
+    with the time functions pre-bound as defaults to skip the module
+    attribute lookups per call.
+    """
+    seconds, ns = divmod(_time_ns(), 1_000_000_000)
+    return (
+        _strftime("%Y-%m-%dT%H:%M:%S", _gmtime(seconds))
+        + f".{ns // 1000:06d}+00:00"
+    )
+
 
 class DynamoDBService:
-    """Service for DynamoDB operations."""
+    """Service for DynamoDB operations.
+
+    Uses aioboto3 so DynamoDB I/O is genuinely asynchronous: the previous
+    sync boto3 calls blocked the event loop for the full round-trip,
+    serializing all concurrent requests on the worker. The async resource
+    is opened once via connect() in the application lifespan and shared for
+    the process lifetime.
+    """
 
     def __init__(self):
-        """Initialize DynamoDB client and table."""
-        self.dynamodb = boto3.resource("dynamodb", region_name=config.aws_region)
-        self.table = self.dynamodb.Table(config.dynamodb_table_name)
+        """Record connection parameters; I/O setup happens in connect()."""
+        config = get_config()
+        self.table_name = config.dynamodb_table_name
+        self.region_name = config.aws_region
+        self.session = get_aws_session()
+        self.table = None
+        self._resource_cm = None
         self.entity_type = "message"  # Constant for GSI partition key
+        # message_id -> (cached_at, Message); see _MESSAGE_CACHE_TTL above
+        self._message_cache: Dict[str, tuple[float, Message]] = {}
+
+    async def connect(self) -> None:
+        """Open the shared async DynamoDB resource and table handle.
+
+        Called from the FastAPI lifespan on startup; the context manager is
+        held open across the application lifetime rather than per request.
+        """
+        self._resource_cm = self.session.resource(
+            "dynamodb", region_name=self.region_name, config=BOTO_CONFIG
+        )
+        dynamodb = await self._resource_cm.__aenter__()
+        self.table = await dynamodb.Table(self.table_name)
+        logger.info("dynamodb_connected", table=self.table_name)
+
+    async def close(self) -> None:
+        """Release the async resource on application shutdown."""
+        if self._resource_cm is not None:
+            await self._resource_cm.__aexit__(None, None, None)
+            self._resource_cm = None
+            self.table = None
 
     async def create_message(self, message_data: MessageCreate) -> Message:
         """
@@ -37,9 +131,10 @@ class DynamoDBService:
             ClientError: If DynamoDB operation fails
         """
         try:
-            # Generate UUID and timestamp
-            message_id = str(uuid.uuid4())
-            timestamp = datetime.now(timezone.utc).isoformat()
+            # Generate UUID and timestamp; .hex skips the dash-formatting of
+            # str(uuid4) and yields a slightly smaller key
+            message_id = uuid.uuid4().hex
+            timestamp = _iso_now()
 
             # Prepare item for DynamoDB
             item = {
@@ -55,11 +150,13 @@ class DynamoDBService:
                 item["metadata"] = message_data.metadata
 
             # Store in DynamoDB
-            logger.info("dynamodb_put_item", message_id=message_id)
-            self.table.put_item(Item=item)
+            logger.debug("dynamodb_put_item", message_id=message_id)
+            await self.table.put_item(Item=item)
 
-            # Return created message
-            return Message(
+            # Return created message. model_construct skips re-validation:
+            # every field either came from the already-validated MessageCreate
+            # or was generated here.
+            return Message.model_construct(
                 message_id=message_id,
                 agent_name=message_data.agent_name,
                 message_text=message_data.message_text,
@@ -82,6 +179,77 @@ class DynamoDBService:
             logger.error("unexpected_error", operation="create_message", error=str(e))
             raise
 
+    async def batch_create_messages(
+        self, messages: List[MessageCreate]
+    ) -> List[Message]:
+        """
+        Create many messages through DynamoDB's batched write path.
+
+        batch_writer groups puts into BatchWriteItem calls of up to 25
+        items and re-queues UnprocessedItems internally, so an import or
+        replay of N messages costs roughly N/25 round trips instead of N
+        sequential put_item calls.
+
+        Args:
+            messages: Validated message creation payloads
+
+        Returns:
+            List of created messages with generated IDs and timestamps,
+            in input order
+
+        Raises:
+            ClientError: If a DynamoDB batch operation fails
+        """
+        try:
+            items: List[Dict[str, Any]] = []
+            created: List[Message] = []
+            for message_data in messages:
+                message_id = uuid.uuid4().hex
+                timestamp = _iso_now()
+                item: Dict[str, Any] = {
+                    "message_id": message_id,
+                    "timestamp": timestamp,
+                    "entity_type": self.entity_type,  # For GSI
+                    "agent_name": message_data.agent_name,
+                    "message_text": message_data.message_text,
+                }
+                if message_data.metadata:
+                    item["metadata"] = message_data.metadata
+                items.append(item)
+                created.append(
+                    Message.model_construct(
+                        message_id=message_id,
+                        agent_name=message_data.agent_name,
+                        message_text=message_data.message_text,
+                        timestamp=timestamp,
+                        metadata=message_data.metadata,
+                    )
+                )
+
+            logger.debug("dynamodb_batch_put", count=len(items))
+            async with self.table.batch_writer() as batch:
+                for item in items:
+                    await batch.put_item(Item=item)
+
+            return created
+
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            error_message = e.response["Error"]["Message"]
+            logger.error(
+                "dynamodb_error",
+                operation="batch_write_item",
+                error_code=error_code,
+                error_message=error_message,
+            )
+            raise
+
+        except Exception as e:
+            logger.error(
+                "unexpected_error", operation="batch_create_messages", error=str(e)
+            )
+            raise
+
     async def get_message_by_id(self, message_id: str) -> Optional[Message]:
         """
         Get a specific message by ID.
@@ -98,32 +266,63 @@ class DynamoDBService:
         Raises:
             ClientError: If DynamoDB operation fails
         """
-        try:
-            logger.info("dynamodb_query", message_id=message_id)
+        now = time.monotonic()
+        cached = self._message_cache.get(message_id)
+        if cached is not None and now - cached[0] < _MESSAGE_CACHE_TTL:
+            return cached[1]
 
-            # Query by partition key (message_id)
-            response = self.table.query(
+        try:
+            logger.debug("dynamodb_query", message_id=message_id)
+
+            # Query by partition key (message_id). Eventually consistent is
+            # explicit: strong consistency costs double RCUs and higher tail
+            # latency for data that never changes after the write. The
+            # projection keeps response bytes to exactly the Message fields
+            # (names aliased wholesale; timestamp is reserved).
+            response = await self.table.query(
                 KeyConditionExpression="message_id = :message_id",
                 ExpressionAttributeValues={":message_id": message_id},
-                Limit=1
+                ProjectionExpression="#f0, #f1, #f2, #f3, #f4",
+                ExpressionAttributeNames={
+                    "#f0": "message_id",
+                    "#f1": "agent_name",
+                    "#f2": "message_text",
+                    "#f3": "timestamp",
+                    "#f4": "metadata",
+                },
+                ConsistentRead=False,
+                Limit=1,
             )
 
             items = response.get("Items", [])
             if not items:
-                logger.info("dynamodb_item_not_found", message_id=message_id)
+                logger.debug("dynamodb_item_not_found", message_id=message_id)
                 return None
 
             item = items[0]
 
-            # Convert DynamoDB item to Message model
-            return Message(
+            # Convert DynamoDB item to Message model without re-validating:
+            # the item was validated on write, so model_construct's plain
+            # attribute assignment is enough. Metadata Decimals are
+            # converted here so the model (and the cache entry built from
+            # it) serializes cleanly through orjson.
+            metadata = item.get("metadata")
+            message = Message.model_construct(
                 message_id=item["message_id"],
                 agent_name=item["agent_name"],
                 message_text=item["message_text"],
                 timestamp=item["timestamp"],
-                metadata=item.get("metadata"),
+                metadata=None if metadata is None else _convert_decimals(metadata),
             )
 
+            # Wholesale eviction at the cap keeps this a plain dict; a
+            # refill is one cheap query per id. Misses (None) are not
+            # cached so a not-yet-replicated write can still be found.
+            if len(self._message_cache) >= _MESSAGE_CACHE_MAX:
+                self._message_cache.clear()
+            self._message_cache[message_id] = (now, message)
+            return message
+
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             error_message = e.response["Error"]["Message"]
@@ -142,26 +341,37 @@ class DynamoDBService:
     async def list_messages(
         self,
         limit: int = 50,
-        start_key: Optional[str] = None
-    ) -> tuple[List[Message], Optional[str]]:
+        start_key: Optional[str] = None,
+        projection: Optional[List[str]] = None,
+    ) -> tuple[List[Dict[str, Any]], Optional[str]]:
         """
         List messages in reverse chronological order using GSI.
 
+        Returns the raw DynamoDB items (already JSON-shaped dicts) rather
+        than Message models: the callers serialize them straight back to
+        JSON, so building a Pydantic model per row would just add N
+        validator invocations on our own trusted writes. The projection
+        keeps the internal entity_type GSI key out of the results.
+
         Args:
             limit: Maximum number of messages to return (default: 50, max: 100)
             start_key: Pagination token from previous request
+            projection: Optional list of attribute names to fetch; callers
+                that discard attributes (e.g. the public endpoint dropping
+                metadata) should project them away so DynamoDB never sends
+                the bytes at all. Defaults to the Message payload fields,
+                which excludes the internal entity_type GSI key.
 
         Returns:
-            Tuple of (list of messages, next pagination token)
+            Tuple of (list of message dicts, next pagination token)
 
         Raises:
             ClientError: If DynamoDB operation fails
         """
         try:
-            # Ensure limit is within bounds
-            limit = min(max(1, limit), 100)
-
-            # Build query parameters
+            # Build query parameters. limit arrives already bounds-checked
+            # by the route's Query(ge=1, le=100) validation; re-clamping
+            # here would just duplicate it.
             query_params: Dict[str, Any] = {
                 "IndexName": "timestamp-index",
                 "KeyConditionExpression": "entity_type = :entity_type",
@@ -170,41 +380,59 @@ class DynamoDBService:
                 "Limit": limit,
             }
 
-            # Add pagination token if provided
+            # Fetch only the requested attributes. Names are aliased
+            # wholesale since timestamp (and potentially future fields)
+            # collide with DynamoDB reserved words.
+            names = {
+                f"#p{i}": attr
+                for i, attr in enumerate(projection or _DEFAULT_LIST_PROJECTION)
+            }
+            query_params["ProjectionExpression"] = ", ".join(names)
+            query_params["ExpressionAttributeNames"] = names
+
+            # Add pagination token if provided. Tokens are the full
+            # LastEvaluatedKey encoded as urlsafe base64 JSON, so the key
+            # shape is opaque to clients and the GSI can later grow a
+            # message_id tiebreaker without breaking stored tokens.
             if start_key:
                 try:
-                    # Parse the pagination token (base64 encoded JSON in production)
-                    # For simplicity, we'll use the timestamp directly
+                    exclusive_start = orjson.loads(
+                        base64.b64decode(start_key, altchars=b"-_", validate=True)
+                    )
+                    if not isinstance(exclusive_start, dict):
+                        raise ValueError("pagination token is not a key dict")
+                    query_params["ExclusiveStartKey"] = exclusive_start
+                except ValueError:
+                    # Legacy tokens were the raw timestamp string; keep
+                    # accepting them so in-flight pagination survives a
+                    # rolling deploy
                     query_params["ExclusiveStartKey"] = {
                         "entity_type": self.entity_type,
                         "timestamp": start_key,
                     }
-                except Exception as e:
-                    logger.warning("invalid_pagination_token", error=str(e))
-
-            logger.info("dynamodb_query_index", limit=limit)
-            response = self.table.query(**query_params)
-
-            # Convert items to Message models
-            messages = [
-                Message(
-                    message_id=item["message_id"],
-                    agent_name=item["agent_name"],
-                    message_text=item["message_text"],
-                    timestamp=item["timestamp"],
-                    metadata=item.get("metadata"),
-                )
-                for item in response.get("Items", [])
-            ]
 
-            # Get next pagination token
+            logger.debug("dynamodb_query_index", limit=limit)
+            response = await self.table.query(**query_params)
+
+            # The projection never includes entity_type, so the items are
+            # already exactly the message payload. Metadata numbers come
+            # back as Decimal and must be converted before orjson sees them.
+            items = response.get("Items", [])
+            for item in items:
+                metadata = item.get("metadata")
+                if metadata is not None:
+                    item["metadata"] = _convert_decimals(metadata)
+
+            # Encode the full LastEvaluatedKey as the next pagination token
             next_key = None
             last_evaluated_key = response.get("LastEvaluatedKey")
             if last_evaluated_key:
-                next_key = last_evaluated_key.get("timestamp")
+                next_key = base64.urlsafe_b64encode(
+                    orjson.dumps(last_evaluated_key)
+                ).decode("ascii")
 
-            logger.info("dynamodb_query_complete", count=len(messages))
-            return messages, next_key
+            logger.debug("dynamodb_query_complete", count=len(items))
+            return items, next_key
 
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -221,6 +449,124 @@ class DynamoDBService:
             logger.error("unexpected_error", operation="list_messages", error=str(e))
             raise
 
+    async def list_messages_range(
+        self,
+        start_ts: str,
+        end_ts: str,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        List messages within a timestamp range, querying both ends in parallel.
+
+        Two mirrored queries — newest-first from the top of the range and
+        oldest-first from the bottom — each fetch half the target. When the
+        range holds at most limit messages the halves overlap and merge
+        into the complete result at roughly half the wall time. When both
+        halves come back full without meeting, the messages between them
+        were never fetched, so the method falls back to a single
+        newest-first query for the full limit rather than return a sample
+        with a silent gap; the result is always contiguous from the top of
+        the range. De-duplicated, sorted newest-first, truncated.
+
+        Service-layer API only for now: no route calls this yet; it is
+        here for range-scoped consumers such as exports or moderation
+        tooling.
+
+        Args:
+            start_ts: Inclusive lower timestamp bound (ISO 8601)
+            end_ts: Inclusive upper timestamp bound (ISO 8601)
+            limit: Maximum number of messages to return
+
+        Returns:
+            List of message dicts in reverse chronological order
+
+        Raises:
+            ClientError: If either DynamoDB query fails
+        """
+        try:
+            half = (limit + 1) // 2
+            base: Dict[str, Any] = {
+                "IndexName": "timestamp-index",
+                "KeyConditionExpression": (
+                    "entity_type = :et AND #ts BETWEEN :lo AND :hi"
+                ),
+                "ExpressionAttributeValues": {
+                    ":et": self.entity_type,
+                    ":lo": start_ts,
+                    ":hi": end_ts,
+                },
+                "ExpressionAttributeNames": {"#ts": "timestamp"},
+                "Limit": half,
+            }
+
+            logger.debug("dynamodb_query_range", limit=limit)
+            newest, oldest = await asyncio.gather(
+                self.table.query(**base, ScanIndexForward=False),
+                self.table.query(**base, ScanIndexForward=True),
+            )
+
+            newest_items = newest.get("Items", [])
+            oldest_items = oldest.get("Items", [])
+
+            # Both halves full with no common item means the range holds
+            # more than fits in them and the middle was never fetched;
+            # serve a contiguous page from the top instead of a gapped
+            # sample. One extra sequential query, taken only on large
+            # ranges.
+            if len(newest_items) == half and len(oldest_items) == half:
+                newest_ids = {item["message_id"] for item in newest_items}
+                if not any(
+                    item["message_id"] in newest_ids for item in oldest_items
+                ):
+                    logger.debug("dynamodb_query_range_fallback", limit=limit)
+                    response = await self.table.query(
+                        **{**base, "Limit": limit}, ScanIndexForward=False
+                    )
+                    newest_items = response.get("Items", [])
+                    oldest_items = []
+
+            seen = set()
+            merged: List[Dict[str, Any]] = []
+            for item in newest_items + oldest_items:
+                message_id = item["message_id"]
+                if message_id in seen:
+                    continue
+                seen.add(message_id)
+                item.pop("entity_type", None)
+                metadata = item.get("metadata")
+                if metadata is not None:
+                    item["metadata"] = _convert_decimals(metadata)
+                merged.append(item)
+
+            merged.sort(key=lambda item: item["timestamp"], reverse=True)
+            del merged[limit:]
+            return merged
+
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            error_message = e.response["Error"]["Message"]
+            logger.error(
+                "dynamodb_error",
+                operation="query_range",
+                error_code=error_code,
+                error_message=error_message,
+            )
+            raise
+
+        except Exception as e:
+            logger.error(
+                "unexpected_error", operation="list_messages_range", error=str(e)
+            )
+            raise
+
+
+@lru_cache(maxsize=1)
+def get_dynamodb_service() -> DynamoDBService:
+    """Build and cache the shared service instance on first use.
 
-# Global service instance
-dynamodb_service = DynamoDBService()
+    Constructing the aioboto3 session runs botocore's service-model loader;
+    doing it lazily keeps that off the import path (shorter cold starts,
+    and modules import cleanly without AWS credentials). Mirrors the
+    get_config() accessor pattern.
+    """
+    return DynamoDBService()
@@ -1,45 +1,91 @@
 """API key management - reads from environment variable (injected via K8s Secret)."""
 
-import json
-from typing import List
+import os
+from typing import Optional
 
+import orjson
 import structlog
+from dotenv import load_dotenv
 
-from app.config import config
+from app.config import get_config
 
 logger = structlog.get_logger()
 
+# Memoized parse result. The environment variable cannot change for the
+# lifetime of the pod (ESO rotates secrets via restart), so re-running
+# json.loads plus validation on every call is pure waste; the background
+# refresh task passes force_reload=True to bypass the cache deliberately.
+# A plain module global rather than lru_cache so that bypass is possible.
+_cached_keys: Optional[frozenset[str]] = None
 
-def get_api_keys() -> List[str]:
+
+def get_api_keys(force_reload: bool = False) -> frozenset[str]:
     """
     Get API keys from environment variable.
 
     The API_KEYS environment variable is injected from a Kubernetes Secret,
     which is synced from AWS Secrets Manager by External Secrets Operator.
+    The parsed result is cached after the first successful call; pass
+    force_reload=True to go back to the source (used by the key-refresh
+    task): the .env file is re-read with override so a rotated mount wins
+    over the stale process environment, then API_KEYS is read directly
+    rather than through the lru_cache'd config snapshot.
+
+    Args:
+        force_reload: Skip the cache and re-read the key source
 
     Returns:
-        List[str]: List of valid API keys
+        frozenset[str]: Set of valid API keys. A set rather than a list so
+        membership-style consumers get O(1) lookups; the auth middleware
+        compares HMAC digests, so ordering never mattered anyway.
 
     Raises:
         ValueError: If API_KEYS format is invalid
     """
+    global _cached_keys
+
+    if _cached_keys is not None and not force_reload:
+        return _cached_keys
+
+    if force_reload:
+        # get_config() holds a one-shot snapshot of the environment, so a
+        # forced reload must bypass it: refresh the process environment
+        # from .env (override=True so a rotated file replaces stale values)
+        # and read the variable directly.
+        load_dotenv(override=True)
+        raw_keys = os.environ.get("API_KEYS", "")
+    else:
+        raw_keys = get_config().api_keys
+
+    if not raw_keys:
+        raise ValueError(
+            "API_KEYS environment variable is not set (expected a JSON array of keys)"
+        )
+
     try:
-        # Parse JSON array from environment variable
-        api_keys = json.loads(config.api_keys)
+        # Parse JSON array from environment variable (orjson: same parse at
+        # C speed, consistent with the response-serialization path)
+        api_keys = orjson.loads(raw_keys)
 
         if not isinstance(api_keys, list):
             raise ValueError("API_KEYS must be a JSON array")
 
+        # Validate element types here, once, so downstream consumers never
+        # need per-key isinstance re-checks
+        if not all(isinstance(key, str) for key in api_keys):
+            raise ValueError("API_KEYS must contain only strings")
+
         # Filter out empty keys
-        valid_keys = [key for key in api_keys if key and isinstance(key, str)]
+        valid_keys = frozenset(key for key in api_keys if key)
 
         if not valid_keys:
             raise ValueError("No valid API keys found in API_KEYS")
 
         logger.info("api_keys_loaded", count=len(valid_keys))
+        _cached_keys = valid_keys
         return valid_keys
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error("api_keys_json_parse_error", error=str(e))
         raise ValueError(f"Invalid JSON in API_KEYS: {e}")
 
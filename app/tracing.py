@@ -15,22 +15,50 @@ Usage:
 
 import logging
 import os
+from contextvars import ContextVar
+from functools import lru_cache
 from typing import Optional
 
+# Only the lightweight opentelemetry-api surface is imported at module
+# level; the SDK, the gRPC OTLP exporter and the X-Ray extensions are
+# imported inside setup_tracing() after the endpoint check, so local dev
+# and tests (where OTEL_EXPORTER_OTLP_ENDPOINT is unset) never pay the
+# hundreds of milliseconds those imports cost at process start.
 from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.resources import Resource, SERVICE_NAME
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.extension.aws.trace import AwsXRayIdGenerator
-from opentelemetry.propagate import set_global_textmap
-from opentelemetry.propagators.aws import AwsXRayPropagator
 
 logger = logging.getLogger(__name__)
 
 # Global flag to prevent double initialization
 _tracing_initialized = False
 
+# Per-request cache of the formatted X-Ray trace ID. get_current_trace_id()
+# is called from both the logging middleware and the global exception
+# handler; the first call in a request context computes and stores the
+# string, later calls in the same context reuse it. Each request runs in its
+# own task (and therefore its own context), so entries never leak between
+# requests.
+_xray_trace_id_var: ContextVar[Optional[str]] = ContextVar(
+    "xray_trace_id", default=None
+)
+
+
+@lru_cache(maxsize=1)
+def _build_resource(service_name: str, environment: str):
+    """Build the service Resource once per process.
+
+    Resource.create probes environment detectors on every call; caching it
+    means harnesses that tear down and re-run setup paths (e.g. spinning
+    several app instances in one process) only pay that probe once. Import
+    is local for the same laziness reason as in setup_tracing().
+    """
+    from opentelemetry.sdk.resources import Resource, SERVICE_NAME
+
+    return Resource.create({
+        SERVICE_NAME: service_name,
+        "deployment.environment": environment,
+        "service.namespace": "guestbook",
+    })
+
 
 def setup_tracing() -> None:
     """
@@ -64,12 +92,20 @@ def setup_tracing() -> None:
         return
 
     try:
-        # Create resource with service metadata
-        resource = Resource.create({
-            SERVICE_NAME: service_name,
-            "deployment.environment": environment,
-            "service.namespace": "guestbook",
-        })
+        # Heavy imports deferred to here: the SDK and the gRPC exporter
+        # stack only load when an endpoint is actually configured
+        import grpc
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.extension.aws.trace import AwsXRayIdGenerator
+        from opentelemetry.propagate import set_global_textmap
+        from opentelemetry.propagators.aws import AwsXRayPropagator
+
+        # Create (or reuse) the resource with service metadata
+        resource = _build_resource(service_name, environment)
 
         # Create tracer provider with AWS X-Ray ID generator
         # X-Ray requires specific trace ID format (starts with timestamp)
@@ -78,14 +114,29 @@ def setup_tracing() -> None:
             id_generator=AwsXRayIdGenerator(),
         )
 
-        # Configure OTLP exporter to send traces to CloudWatch Agent
+        # Configure OTLP exporter to send traces to CloudWatch Agent.
+        # gzip costs a little exporter CPU but shrinks span batches several
+        # fold on the wire; the exporter reuses one persistent gRPC channel
+        # across flushes.
         otlp_exporter = OTLPSpanExporter(
             endpoint=otlp_endpoint,
             insecure=True,  # CloudWatch Agent uses HTTP within cluster
+            compression=grpc.Compression.Gzip,
         )
 
-        # Use batch processor for efficient trace export
-        provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
+        # Use batch processor for efficient trace export. The defaults
+        # (512 queue, 5s delay, 512 per batch) drop spans under request
+        # bursts; a deeper queue plus larger, more frequent batches keeps
+        # export overhead flat at higher RPS.
+        provider.add_span_processor(
+            BatchSpanProcessor(
+                otlp_exporter,
+                max_queue_size=8192,
+                schedule_delay_millis=2000,
+                max_export_batch_size=1024,
+                export_timeout_millis=10_000,
+            )
+        )
 
         # Set as global tracer provider
         trace.set_tracer_provider(provider)
@@ -145,6 +196,13 @@ def instrument_fastapi(app) -> None:
         logger.error(f"Failed to instrument FastAPI: {e}", exc_info=True)
 
 
+# Bound once: both helpers below run per request for log enrichment, and
+# the module attribute walk (trace.get_current_span) is avoidable overhead
+# on that path. get_current_span returns INVALID_SPAN rather than None, so
+# a zero trace/span id is the only invalid case to check.
+_get_span = trace.get_current_span
+
+
 def get_current_trace_id() -> Optional[str]:
     """
     Get the current trace ID in AWS X-Ray format.
@@ -153,20 +211,20 @@ def get_current_trace_id() -> Optional[str]:
         X-Ray formatted trace ID (e.g., "1-6cc26f91-65fdeff175a58f4ed6f36ef5")
         or None if no active span.
     """
-    span = trace.get_current_span()
-    if span is None:
-        return None
+    cached = _xray_trace_id_var.get()
+    if cached is not None:
+        return cached
 
-    span_context = span.get_span_context()
-    if not span_context.is_valid:
+    trace_id = _get_span().get_span_context().trace_id
+    if trace_id == 0:
         return None
 
-    # Convert OpenTelemetry trace ID to X-Ray format
-    # X-Ray format: 1-{8 hex digits timestamp}-{24 hex digits random}
-    trace_id_hex = format(span_context.trace_id, "032x")
-
-    # X-Ray trace IDs start with version (1), then timestamp, then random
-    return f"1-{trace_id_hex[:8]}-{trace_id_hex[8:]}"
+    # X-Ray format: 1-{8 hex digit timestamp}-{24 hex digit random}. The
+    # split is done with integer shifts/masks so the hex conversion happens
+    # once per half, with no intermediate 32-char string to slice.
+    xray_trace_id = f"1-{trace_id >> 96:08x}-{trace_id & ((1 << 96) - 1):024x}"
+    _xray_trace_id_var.set(xray_trace_id)
+    return xray_trace_id
 
 
 def get_current_span_id() -> Optional[str]:
@@ -176,15 +234,11 @@ def get_current_span_id() -> Optional[str]:
     Returns:
         Span ID as hex string or None if no active span.
     """
-    span = trace.get_current_span()
-    if span is None:
-        return None
-
-    span_context = span.get_span_context()
-    if not span_context.is_valid:
+    span_id = _get_span().get_span_context().span_id
+    if span_id == 0:
         return None
 
-    return format(span_context.span_id, "016x")
+    return f"{span_id:016x}"
 
 
 def get_tracer(name: str = __name__):